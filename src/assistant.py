@@ -1,33 +1,146 @@
 """Core AI assistant implementation with streaming support."""
+import asyncio
 import json
-from typing import Optional, Dict, Any
-from openai import AsyncOpenAI
+from typing import Optional, Dict, Any, AsyncIterator, Tuple, Union
+from openai import APIError, AsyncOpenAI
 from src import config
+from src.blob_store import BlobRef, BlobStore
 from src.display import Display
-from src.tools import ToolRegistry
+from src.router import ModelRouter
+from src.tools import ToolRegistry, ToolStream
 from src.tools.implementations import available_tools
 
 class Assistant:
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+        self.client = AsyncOpenAI(api_key=config.OPENAI_API_KEY, base_url=config.OPENAI_BASE_URL)
         self.display = Display()
+        self.router = ModelRouter()
         self.conversation_history = []
+        self.blob_store = BlobStore(config.BLOB_STORE_DIR)
         
         # Initialize and register tools
         self.tool_registry = ToolRegistry()
         for tool_class in available_tools:
             self.tool_registry.register(tool_class)
 
+    def _store_content(self, content: str) -> Union[str, BlobRef]:
+        """Move large content into the blob store, returning a reference."""
+        if len(content.encode("utf-8")) < config.BLOB_MIN_SIZE:
+            return content
+        return self.blob_store.put(content)
+
+    def _expand_message(self, message: dict) -> dict:
+        """Resolve a blob reference in a history entry to its content."""
+        if isinstance(message.get("content"), BlobRef):
+            return {**message, "content": self.blob_store.get(message["content"])}
+        return message
+
     def _create_messages(self, user_input: str) -> list[dict]:
         """Create messages list for the API call."""
         return [
             {"role": "system", "content": config.DEFAULT_SYSTEM_MESSAGE},
-            *self.conversation_history,
+            *(self._expand_message(message) for message in self.conversation_history),
             {"role": "user", "content": user_input}
         ]
 
+    def clear_history(self) -> None:
+        """Clear the conversation history and release stored blobs."""
+        self.conversation_history = []
+        self.blob_store.clear()
+
+    def _record_tool_call(self, name: str, arguments: str, result: str) -> None:
+        """Add a tool call and its result to the conversation history."""
+        call_id = "call_" + str(len(self.conversation_history))
+        self.conversation_history.extend([
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [{
+                    "id": call_id,
+                    "type": "function",
+                    "function": {
+                        "name": name,
+                        "arguments": arguments
+                    }
+                }]
+            },
+            {
+                "role": "tool",
+                "content": self._store_content(result),
+                "tool_call_id": call_id
+            }
+        ])
+
+    async def _open_stream(self, model: str, messages: list[dict]) -> Tuple[Any, Any, AsyncIterator]:
+        """Start a completion and wait for its first chunk."""
+        response = await self.client.chat.completions.create(
+            model=model,
+            messages=messages,
+            tools=self.tool_registry.get_tools(),
+            stream=True
+        )
+        chunks = response.__aiter__()
+        try:
+            first = await chunks.__anext__()
+        except StopAsyncIteration:
+            first = None
+        except BaseException:
+            # Cancelled by a missed deadline or failed; drop the connection
+            await response.close()
+            raise
+        return response, first, chunks
+
+    @staticmethod
+    async def _chain(response: Any, first: Any, chunks: AsyncIterator) -> AsyncIterator:
+        """Yield the already-received first chunk, then the rest.
+        
+        The response is closed once the chunks are exhausted or the
+        generator is closed early.
+        """
+        try:
+            if first is not None:
+                yield first
+                async for chunk in chunks:
+                    yield chunk
+        finally:
+            await response.close()
+
+    async def _open_routed_stream(self, user_input: str) -> AsyncIterator:
+        """Open a response stream on the model chosen by the router.
+        
+        Each candidate gets until the deadline to produce its first token
+        before the next one is tried, and an API error also moves on to the
+        next one. The last candidate is always awaited and its errors raised.
+        """
+        messages = self._create_messages(user_input)
+        prompt_chars = sum(len(message.get("content") or "") for message in messages)
+        decision = self.router.route(user_input, prompt_chars)
+        loop = asyncio.get_running_loop()
+
+        for index, model in enumerate(decision.candidates):
+            is_last = index == len(decision.candidates) - 1
+            start = loop.time()
+            try:
+                response, first, chunks = await asyncio.wait_for(
+                    self._open_stream(model, messages),
+                    timeout=None if is_last else self.router.deadline
+                )
+            except asyncio.TimeoutError:
+                self.router.record_miss(decision, model)
+                continue
+            except APIError:
+                if is_last:
+                    raise
+                self.router.record_error(decision, model)
+                continue
+            self.router.record_ttft(decision, model, loop.time() - start)
+            return self._chain(response, first, chunks)
+
     async def get_response(self, user_input: str) -> None:
         """Get streaming response from the AI."""
+        # Streaming handler for the current tool call, if the tool supports one
+        current_stream: Optional[ToolStream] = None
+        response = None
         try:
             # Add user message to history right away
             self.conversation_history.append({"role": "user", "content": user_input})
@@ -35,12 +148,7 @@ class Assistant:
             self.display.show_user_input(user_input)
             self.display.show_thinking()
 
-            response = await self.client.chat.completions.create(
-                model=config.DEFAULT_MODEL,
-                messages=self._create_messages(user_input),
-                tools=self.tool_registry.get_tools(),
-                stream=True
-            )
+            response = await self._open_routed_stream(user_input)
 
             self.display.clear_thinking()
             self.display.start_streaming()
@@ -61,7 +169,31 @@ class Assistant:
                                 "name": tool_call.function.name,
                                 "arguments": ""
                             }
-                        if tool_call.function.arguments:
+                            current_stream = self.tool_registry.create_stream(current_tool_call["name"])
+                        if tool_call.function.arguments and current_stream is not None:
+                            # Let the tool consume arguments as they arrive
+                            try:
+                                current_stream.feed(tool_call.function.arguments)
+                            except Exception as e:
+                                # End the turn; the rest of this call's arguments are unusable
+                                self.display.update_streaming(f"\n[Tool Error: {str(e)}]\n")
+                                return
+
+                            if current_stream.complete:
+                                result = await self.tool_registry.finish_stream(
+                                    current_tool_call["name"],
+                                    current_stream
+                                )
+                                self._record_tool_call(
+                                    current_tool_call["name"],
+                                    current_stream.arguments(),
+                                    result
+                                )
+                                self.display.update_streaming(result)
+                                current_stream = None
+                                current_tool_call = None
+                                return  # Exit after tool execution
+                        elif tool_call.function.arguments:
                             current_tool_args += tool_call.function.arguments
                             
                             # Try to parse JSON to see if it's complete
@@ -76,25 +208,7 @@ class Assistant:
                                     )
                                     
                                     # Add tool call and result to conversation
-                                    self.conversation_history.extend([
-                                        {
-                                            "role": "assistant",
-                                            "content": None,
-                                            "tool_calls": [{
-                                                "id": "call_" + str(len(self.conversation_history)),
-                                                "type": "function",
-                                                "function": {
-                                                    "name": current_tool_call["name"],
-                                                    "arguments": current_tool_args
-                                                }
-                                            }]
-                                        },
-                                        {
-                                            "role": "tool",
-                                            "content": result,
-                                            "tool_call_id": "call_" + str(len(self.conversation_history))
-                                        }
-                                    ])
+                                    self._record_tool_call(current_tool_call["name"], current_tool_args, result)
                                     
                                     self.display.update_streaming(f"The current time in {args['timezone']} is {result}")
                                     current_tool_call = None
@@ -124,4 +238,10 @@ class Assistant:
         except Exception as e:
             self.display.show_error(str(e))
         finally:
+            # Discard partial output if the stream ended mid tool call
+            if current_stream is not None:
+                current_stream.abort()
+            # Close the connection even when returning before the stream ends
+            if response is not None:
+                await response.aclose()
             self.display.end_streaming()
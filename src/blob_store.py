@@ -0,0 +1,106 @@
+"""Content-addressed storage for large conversation payloads."""
+import atexit
+import hashlib
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+@dataclass(frozen=True)
+class BlobRef:
+    """Reference to a payload held in a BlobStore."""
+    digest: str
+    size: int
+
+class BlobStore:
+    """Stores payloads once, keyed by the SHA-256 of their content.
+
+    Blobs are kept in memory, or on disk when a directory is given. Each
+    ``put`` of identical content returns the same reference and bumps a
+    reference count, so repeated tool results share a single blob.
+
+    On disk, each store uses its own subdirectory of ``directory`` so that
+    several sessions can share it; the subdirectory is removed by clear()
+    and at exit.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        self.directory = None
+        self._blobs: Dict[str, str] = {}
+        self._sizes: Dict[str, int] = {}
+        self._refcounts: Dict[str, int] = {}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            self.directory = tempfile.mkdtemp(dir=directory, prefix="session-")
+            atexit.register(self.clear)
+
+    def _path(self, digest: str) -> str:
+        return os.path.join(self.directory, digest[:2], digest)
+
+    def put(self, content: str) -> BlobRef:
+        """Store content and return a reference to it.
+
+        Args:
+            content: The payload to store
+
+        Returns:
+            A reference that can be resolved with get()
+        """
+        data = content.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        ref = BlobRef(digest=digest, size=len(data))
+
+        if digest in self._refcounts:
+            self._refcounts[digest] += 1
+            return ref
+
+        if self.directory:
+            path = self._path(digest)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with open(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        else:
+            self._blobs[digest] = content
+
+        self._sizes[digest] = ref.size
+        self._refcounts[digest] = 1
+        return ref
+
+    def get(self, ref: BlobRef) -> str:
+        """Return the content for a reference.
+
+        Raises:
+            KeyError: If the blob is not in the store
+        """
+        if ref.digest not in self._refcounts:
+            raise KeyError(f"Blob '{ref.digest}' not found")
+
+        if self.directory:
+            with open(self._path(ref.digest), "rb") as f:
+                return f.read().decode("utf-8")
+        return self._blobs[ref.digest]
+
+    def clear(self) -> None:
+        """Remove every blob from the store."""
+        if self.directory:
+            # put() recreates the subdirectory if the store is used again
+            shutil.rmtree(self.directory, ignore_errors=True)
+        self._blobs.clear()
+        self._sizes.clear()
+        self._refcounts.clear()
+
+    @property
+    def stored_bytes(self) -> int:
+        """Bytes actually held, counting each unique blob once."""
+        return sum(self._sizes.values())
+
+    @property
+    def referenced_bytes(self) -> int:
+        """Bytes that would be held if every reference kept its own copy."""
+        return sum(size * self._refcounts[digest] for digest, size in self._sizes.items())
+
+    def __len__(self) -> int:
+        return len(self._refcounts)
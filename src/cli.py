@@ -11,7 +11,7 @@ assistant = Assistant()
 @app.command()
 def main():
     """Start the AI assistant CLI."""
-    typer.echo("Welcome to the Terminal AI Assistant! Type 'exit' to quit or 'clear' to clear history.\n")
+    typer.echo("Welcome to the Terminal AI Assistant! Type 'exit' to quit, 'clear' to clear history or 'metrics' for model routing stats.\n")
     
     async def chat_loop():
         while True:
@@ -23,10 +23,29 @@ def main():
                 typer.echo("Goodbye!")
                 break
             elif user_input.lower() == 'clear':
+                store = assistant.blob_store
+                typer.echo(
+                    f"Blob store: {len(store)} blob(s), {store.stored_bytes} bytes stored "
+                    f"for {store.referenced_bytes} bytes referenced."
+                )
                 assistant.clear_history()
                 typer.echo("Conversation history cleared.")
                 continue
             
+            elif user_input.lower() == 'metrics':
+                metrics = assistant.router.metrics()
+                if not metrics:
+                    typer.echo("No routing decisions yet.")
+                for model, stats in metrics.items():
+                    ttft = stats["rolling_ttft"]
+                    ttft_text = f"{ttft:.2f}s" if ttft is not None else "n/a"
+                    typer.echo(
+                        f"{model}: {stats['turns']} turn(s), {stats['misses']} miss(es), "
+                        f"{stats['errors']} error(s), "
+                        f"rolling time-to-first-token {ttft_text}"
+                    )
+                continue
+            
             # Get AI response
             await assistant.get_response(user_input)
 
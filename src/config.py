@@ -7,7 +7,31 @@ load_dotenv()
 
 # OpenAI API settings
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
+# Optional alternative endpoint, e.g. a local server for testing
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL")
 DEFAULT_MODEL = "gpt-4-turbo-preview"
+FAST_MODEL = "gpt-3.5-turbo"
+
+# Model routing: the first matching rule gives the models to try, in order.
+# Rules may set "min_prompt_chars" and/or "needs_tools"; one with neither
+# always matches.
+MODEL_ROUTES = [
+    {"min_prompt_chars": 8000, "models": [DEFAULT_MODEL, FAST_MODEL]},
+    {"needs_tools": True, "models": [DEFAULT_MODEL, FAST_MODEL]},
+    {"models": [FAST_MODEL, DEFAULT_MODEL]},
+]
+# Whole words suggesting a prompt needs the file tools
+TOOL_KEYWORDS = ("file", "files", "read", "write", "replace", "edit", "code")
+# File extensions that mark a word as a path, e.g. "main.py"
+TOOL_FILE_EXTENSIONS = ("py", "js", "ts", "json", "md", "txt", "toml", "yaml", "yml", "cfg", "ini", "sh", "html", "css")
+# Seconds to wait for the first token before falling back to the next model
+TTFT_DEADLINE = 5.0
+# Number of recent time-to-first-token samples averaged per model
+TTFT_WINDOW = 20
+# Seconds after which a sample is forgotten, so a demoted model gets retried
+TTFT_SAMPLE_MAX_AGE = 120.0
+# Number of recent routing decisions kept for metrics
+ROUTING_HISTORY = 100
 
 # Terminal display settings
 PROMPT_PREFIX = "🤖 Assistant: "
@@ -38,3 +62,9 @@ SYSTEM_COLOR = "yellow"
 # Tool settings
 TOOL_TIMEOUT = 30  # seconds
 MAX_PARALLEL_TOOLS = 1
+
+# Tool results at least this large (in bytes) are kept in the blob store and
+# referenced from conversation history instead of being copied inline
+BLOB_MIN_SIZE = 4096
+# Directory for the on-disk blob store; blobs stay in memory when unset
+BLOB_STORE_DIR = os.getenv("BLOB_STORE_DIR")
@@ -0,0 +1,155 @@
+"""Per-turn model selection based on configurable routing rules."""
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from src import config
+
+# Tool keywords as whole words, or a path: "/etc/hosts", "./x", "~/x", "main.py"
+_TOOL_HINT = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, config.TOOL_KEYWORDS)) + r")\b"
+    r"|(?:^|\s)(?:~|\.{1,2})?/\S"
+    r"|\b\w+\.(?:" + "|".join(map(re.escape, config.TOOL_FILE_EXTENSIONS)) + r")\b"
+)
+
+@dataclass
+class RoutingDecision:
+    """Record of how a single turn was routed."""
+    candidates: List[str]
+    rule: int
+    prompt_chars: int
+    needs_tools: bool
+    model: Optional[str] = None
+    ttft: Optional[float] = None
+    missed: List[str] = field(default_factory=list)
+    errors: List[str] = field(default_factory=list)
+
+class ModelRouter:
+    """Chooses a model per turn and tracks time-to-first-token per model.
+
+    Rules are evaluated in order and the first match gives the candidate
+    models for the turn. A rule may set ``min_prompt_chars`` and/or
+    ``needs_tools``; a rule with neither always matches. Candidates whose
+    rolling time-to-first-token has reached the deadline are moved behind the
+    ones that are meeting it. Samples expire after ``max_age`` seconds, so
+    a demoted model is tried first again once its misses have aged out.
+    """
+
+    def __init__(
+        self,
+        routes: Optional[List[Dict[str, Any]]] = None,
+        deadline: float = config.TTFT_DEADLINE,
+        window: int = config.TTFT_WINDOW,
+        max_age: float = config.TTFT_SAMPLE_MAX_AGE
+    ):
+        self.routes = routes if routes is not None else config.MODEL_ROUTES
+        self.deadline = deadline
+        # Per model: (monotonic timestamp, seconds) samples
+        self._ttft: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._window = window
+        self.max_age = max_age
+        self.decisions: Deque[RoutingDecision] = deque(maxlen=config.ROUTING_HISTORY)
+
+    @staticmethod
+    def needs_tools(user_input: str) -> bool:
+        """Guess whether a prompt will need one of the heavier tools."""
+        return _TOOL_HINT.search(user_input.lower()) is not None
+
+    def rolling_ttft(self, model: str) -> Optional[float]:
+        """Mean time-to-first-token over recent, unexpired samples, if any."""
+        samples = self._ttft.get(model)
+        if not samples:
+            return None
+        cutoff = time.monotonic() - self.max_age
+        while samples and samples[0][0] < cutoff:
+            samples.popleft()
+        if not samples:
+            return None
+        return sum(seconds for _, seconds in samples) / len(samples)
+
+    def route(self, user_input: str, prompt_chars: int) -> RoutingDecision:
+        """Pick the ordered list of models to try for a turn.
+
+        Args:
+            user_input: The latest user message
+            prompt_chars: Total size of the request messages
+
+        Returns:
+            The decision, with candidates in the order they should be tried
+        """
+        needs_tools = self.needs_tools(user_input)
+
+        for index, route in enumerate(self.routes):
+            if prompt_chars < route.get("min_prompt_chars", 0):
+                continue
+            if route.get("needs_tools") and not needs_tools:
+                continue
+            candidates = list(route["models"]) or [config.DEFAULT_MODEL]
+            break
+        else:
+            index = -1
+            candidates = [config.DEFAULT_MODEL]
+
+        # Stable sort: models meeting the deadline keep their order, slow ones go last
+        candidates.sort(key=lambda model: (self.rolling_ttft(model) or 0.0) >= self.deadline)
+
+        decision = RoutingDecision(
+            candidates=candidates,
+            rule=index,
+            prompt_chars=prompt_chars,
+            needs_tools=needs_tools
+        )
+        self.decisions.append(decision)
+        return decision
+
+    def _record_sample(self, model: str, seconds: float) -> None:
+        if model not in self._ttft:
+            self._ttft[model] = deque(maxlen=self._window)
+        self._ttft[model].append((time.monotonic(), seconds))
+
+    def record_ttft(self, decision: RoutingDecision, model: str, seconds: float) -> None:
+        """Record the model that answered a turn and its time-to-first-token."""
+        self._record_sample(model, seconds)
+        decision.model = model
+        decision.ttft = seconds
+
+    def record_miss(self, decision: RoutingDecision, model: str) -> None:
+        """Record that a model missed the deadline and was abandoned."""
+        self._record_sample(model, self.deadline)
+        decision.missed.append(model)
+
+    def record_error(self, decision: RoutingDecision, model: str) -> None:
+        """Record that a model failed with an API error and was abandoned.
+
+        Errors say nothing about latency, so no TTFT sample is recorded.
+        """
+        decision.errors.append(model)
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Summarise recent routing per model.
+
+        Returns:
+            Mapping of model name to turns served, deadline misses, API
+            errors and rolling time-to-first-token
+        """
+        summary: Dict[str, Dict[str, Any]] = {}
+
+        def entry(model: str) -> Dict[str, Any]:
+            if model not in summary:
+                summary[model] = {
+                    "turns": 0,
+                    "misses": 0,
+                    "errors": 0,
+                    "rolling_ttft": self.rolling_ttft(model)
+                }
+            return summary[model]
+
+        for decision in self.decisions:
+            if decision.model:
+                entry(decision.model)["turns"] += 1
+            for model in decision.missed:
+                entry(model)["misses"] += 1
+            for model in decision.errors:
+                entry(model)["errors"] += 1
+        return summary
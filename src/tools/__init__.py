@@ -1,5 +1,5 @@
 """Tools package for the AI assistant."""
-from .base import Tool, tool
+from .base import Tool, ToolStream, tool
 from .registry import ToolRegistry
 
-__all__ = ['Tool', 'tool', 'ToolRegistry']
+__all__ = ['Tool', 'ToolStream', 'tool', 'ToolRegistry']
@@ -21,6 +21,15 @@ class Tool(ABC):
         """
         raise NotImplementedError
 
+    def create_stream(self) -> Optional["ToolStream"]:
+        """Create a handler that consumes the arguments as they stream in.
+        
+        Returns:
+            ToolStream: Handler for one call, or None if the tool only runs
+            once its full arguments have arrived
+        """
+        return None
+
     def to_openai_function(self) -> Dict[str, Any]:
         """Convert the tool to OpenAI function format."""
         return {
@@ -32,6 +41,43 @@ class Tool(ABC):
             }
         }
 
+class ToolStream(ABC):
+    """Handles a single tool call while its arguments are still streaming."""
+
+    @property
+    @abstractmethod
+    def complete(self) -> bool:
+        """Whether the full arguments have been received."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def feed(self, fragment: str) -> None:
+        """Consume the next fragment of the arguments JSON.
+        
+        Args:
+            fragment: Raw argument text as received from the API
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def finish(self) -> str:
+        """Complete the tool call once all arguments have been received.
+        
+        Returns:
+            str: Result of the tool execution as a string
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def abort(self) -> None:
+        """Discard any partial work; safe to call after finish()."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def arguments(self) -> str:
+        """Arguments JSON to record in the conversation history."""
+        raise NotImplementedError
+
 def tool(name: Optional[str] = None, description: Optional[str] = None):
     """Decorator to register a tool class.
     
@@ -1,7 +1,191 @@
 """File writer tool implementation."""
+import json
 import os
-from typing import List, Dict
-from ..base import Tool, tool
+import secrets
+import shutil
+import tempfile
+from typing import Any, List, Dict, Optional, TextIO, Tuple
+from ..base import Tool, ToolStream, tool
+from ..streaming import Path, StreamingJsonParser
+
+def _existing_parent(path: str) -> str:
+    """Nearest existing directory above a path."""
+    directory = os.path.dirname(path)
+    while not os.path.isdir(directory):
+        directory = os.path.dirname(directory)
+    return directory
+
+class StreamingFileWriter(ToolStream):
+    """Writes each file's content to a temp file as the arguments arrive.
+
+    Temp files are created in the nearest existing directory of their
+    target when the path is already known, and moved into place (or
+    appended) only once the whole call has been received. No directories
+    are created before then, so abort() leaves nothing behind.
+    """
+
+    def __init__(self):
+        self._files: List[Dict[str, Any]] = []
+        self._parser = StreamingJsonParser(self._open_content, self._on_value)
+
+    @property
+    def complete(self) -> bool:
+        return self._parser.complete
+
+    def feed(self, fragment: str) -> None:
+        self._parser.feed(fragment)
+
+    def _file(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Return the entry for a ("files", index, key) path."""
+        if len(path) != 3 or path[0] != "files" or not isinstance(path[1], int):
+            return None
+        while len(self._files) <= path[1]:
+            self._files.append({})
+        return self._files[path[1]]
+
+    def _open_content(self, path: Path) -> Optional[TextIO]:
+        file_info = self._file(path)
+        if file_info is None or path[2] != "content":
+            return None
+
+        # A repeated "content" key replaces the earlier value, as in json.loads
+        self._discard_temp(file_info)
+
+        directory = None
+        if "path" in file_info:
+            directory = _existing_parent(os.path.realpath(file_info["path"]))
+        fd, temp_path = self._mkstemp(directory)
+        file_info["temp_path"] = temp_path
+        file_info["stream"] = open(fd, "w", encoding="utf-8")
+        return file_info["stream"]
+
+    @staticmethod
+    def _mkstemp(directory: Optional[str]) -> Tuple[int, str]:
+        """Create a uniquely named temp file.
+
+        Unlike tempfile.mkstemp the file is created with mode 0o666, so the
+        process umask applies just as it would for open().
+        """
+        directory = directory or tempfile.gettempdir()
+        while True:
+            temp_path = os.path.join(directory, f".write_files-{secrets.token_hex(8)}.tmp")
+            try:
+                return os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666), temp_path
+            except FileExistsError:
+                continue
+
+    @staticmethod
+    def _discard_temp(file_info: Dict[str, Any]) -> None:
+        """Close and delete a file's temp file, if it still has one."""
+        stream = file_info.get("stream")
+        if stream is not None and not stream.closed:
+            stream.close()
+        temp_path = file_info.get("temp_path")
+        if temp_path is not None:
+            try:
+                os.remove(temp_path)
+            except FileNotFoundError:
+                pass
+            file_info["temp_path"] = None
+
+    def _move_next_to(self, file_info: Dict[str, Any], target: str) -> str:
+        """Ensure the temp file is in the target's directory so the final
+        rename is atomic.
+
+        Content that streamed in before its path, or whose target directory
+        did not exist yet, is copied next to the target first.
+        """
+        temp_path = file_info["temp_path"]
+        directory = os.path.dirname(target)
+        if os.path.dirname(temp_path) == directory:
+            return temp_path
+
+        fd, local_path = self._mkstemp(directory)
+        with open(temp_path, "rb") as src, open(fd, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        file_info["temp_path"] = local_path
+        os.remove(temp_path)
+        return local_path
+
+    def _on_value(self, path: Path, value: Any) -> None:
+        file_info = self._file(path)
+        if file_info is not None and path[2] in ("path", "mode"):
+            file_info[path[2]] = value
+
+    async def finish(self) -> str:
+        """Move every written temp file into place.
+        
+        Overwrites are an atomic rename onto the symlink-resolved target.
+        
+        Returns:
+            A string describing the results of the write operations
+            
+        Raises:
+            ValueError: If the arguments are incomplete or a file cannot be written
+        """
+        if not self.complete:
+            raise ValueError("Tool call arguments are incomplete")
+        if not self._files:
+            raise ValueError("No files to write")
+
+        results = []
+
+        for file_info in self._files:
+            path = file_info.get("path")
+            mode = file_info.get("mode", "w")
+            temp_path = file_info.get("temp_path")
+            if path is None or temp_path is None:
+                raise ValueError("Each file needs a 'path' and a 'content'")
+
+            try:
+                if mode not in ("w", "a"):
+                    raise ValueError(f"Invalid mode: {mode}")
+                # Write through symlinks, as open() would
+                target = os.path.realpath(path)
+                if os.path.isdir(target):
+                    raise IsADirectoryError(f"Is a directory: '{path}'")
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                file_info["size"] = os.path.getsize(temp_path)
+
+                if mode == "a":
+                    with open(temp_path, "rb") as src, open(target, "ab") as dst:
+                        shutil.copyfileobj(src, dst)
+                    os.remove(temp_path)
+                else:
+                    temp_path = self._move_next_to(file_info, target)
+                    # New files keep the umask-derived mode from _mkstemp
+                    if os.path.exists(target):
+                        os.chmod(temp_path, os.stat(target).st_mode & 0o777)
+                    os.replace(temp_path, target)
+                file_info["temp_path"] = None
+
+                action = "appended to" if mode == "a" else "written to"
+                results.append(f"Successfully {action} {path}")
+
+            except Exception as e:
+                raise ValueError(f"Error writing to file {path}: {str(e)}")
+
+        return "\n".join(results)
+
+    def abort(self) -> None:
+        for file_info in self._files:
+            self._discard_temp(file_info)
+
+    def arguments(self) -> str:
+        """Arguments with each content replaced by a short note.
+
+        The content was streamed to disk and is not kept in memory.
+        """
+        files = []
+        for file_info in self._files:
+            entry = {
+                "path": file_info.get("path"),
+                "content": f"[{file_info.get('size', 0)} bytes streamed to disk]"
+            }
+            if "mode" in file_info:
+                entry["mode"] = file_info["mode"]
+            files.append(entry)
+        return json.dumps({"files": files})
 
 @tool(
     name="write_files",
@@ -42,6 +226,10 @@ class FileWriterTool(Tool):
         "additionalProperties": False
     }
 
+    def create_stream(self) -> StreamingFileWriter:
+        """Stream file contents to disk while the arguments are arriving."""
+        return StreamingFileWriter()
+
     async def execute(self, files: List[Dict[str, str]]) -> str:
         """Write content to the specified files.
         
@@ -1,7 +1,7 @@
 """Tool registry and management system."""
-from typing import Dict, List, Type, Any
+from typing import Dict, List, Optional, Type, Any
 import asyncio
-from .base import Tool
+from .base import Tool, ToolStream
 
 class ToolRegistry:
     """Registry for managing and executing tools."""
@@ -54,3 +54,37 @@ class ToolRegistry:
             return f"Error: Tool '{name}' execution timed out"
         except Exception as e:
             return f"Error executing tool '{name}': {str(e)}"
+
+    def create_stream(self, name: str) -> Optional[ToolStream]:
+        """Create a streaming argument handler for a tool, if it supports one.
+        
+        Args:
+            name: Name of the tool being called
+            
+        Returns:
+            A ToolStream for the call, or None if the tool does not stream
+            or is not registered (execute_tool reports unknown tools)
+        """
+        if name not in self._tools:
+            return None
+        return self._tools[name].create_stream()
+
+    async def finish_stream(self, name: str, stream: ToolStream) -> str:
+        """Complete a streamed tool call.
+        
+        Args:
+            name: Name of the tool being called
+            stream: The handler that received the call's arguments
+            
+        Returns:
+            Tool execution result as a string
+        """
+        try:
+            result = await asyncio.wait_for(stream.finish(), timeout=30)
+            return str(result)
+        except asyncio.TimeoutError:
+            stream.abort()
+            return f"Error: Tool '{name}' execution timed out"
+        except Exception as e:
+            stream.abort()
+            return f"Error executing tool '{name}': {str(e)}"
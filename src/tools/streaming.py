@@ -0,0 +1,242 @@
+"""Incremental parsing of tool-call arguments as they stream in."""
+import json
+import re
+from typing import Any, Callable, List, Optional, TextIO, Tuple
+
+Path = Tuple[Any, ...]
+
+_ESCAPES = {
+    '"': '"',
+    '\\': '\\',
+    '/': '/',
+    'b': '\b',
+    'f': '\f',
+    'n': '\n',
+    'r': '\r',
+    't': '\t'
+}
+_STRING_SPECIAL = re.compile(r'["\\\x00-\x1f]')
+_HEX_DIGITS = set('0123456789abcdefABCDEF')
+_LITERAL_START = set('-0123456789tfn')
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = ',}]' + _WHITESPACE
+
+class StreamingJsonParser:
+    """Parses a JSON document fed in arbitrary fragments.
+
+    Values are reported by their path from the root, e.g.
+    ``("files", 0, "path")``. String values for which ``open_string``
+    returns a text stream are decoded straight into that stream and never
+    held in memory; every other value is passed to ``on_value`` once it
+    is complete.
+    """
+
+    def __init__(
+        self,
+        open_string: Callable[[Path], Optional[TextIO]],
+        on_value: Callable[[Path, Any], None]
+    ):
+        self._open_string = open_string
+        self._on_value = on_value
+        self._stack: List[dict] = []
+        self._started = False
+        self.complete = False
+
+        # Scalar/string state
+        self._in_string = False
+        self._is_key = False
+        self._sink: Optional[TextIO] = None
+        self._buffer: List[str] = []
+        self._escape: Optional[str] = None
+        self._high_surrogate: Optional[int] = None
+        self._literal: Optional[str] = None
+
+    def feed(self, fragment: str) -> None:
+        """Consume the next fragment of the document.
+
+        Raises:
+            ValueError: If the fragment makes the document invalid JSON
+        """
+        i = 0
+        n = len(fragment)
+        while i < n:
+            if self._in_string:
+                i = self._feed_string(fragment, i)
+            elif self._literal is not None:
+                ch = fragment[i]
+                if ch in _DELIMITERS:
+                    self._end_literal()
+                else:
+                    self._literal += ch
+                    i += 1
+            else:
+                self._feed_structure(fragment[i])
+                i += 1
+
+    def _path(self) -> Path:
+        return tuple(
+            frame["key"] if frame["type"] == "object" else frame["index"]
+            for frame in self._stack
+        )
+
+    def _expecting_value(self) -> bool:
+        if not self._stack:
+            return not self._started
+        return self._stack[-1]["expect"] == "value"
+
+    def _feed_structure(self, ch: str) -> None:
+        if ch in _WHITESPACE:
+            return
+        if self.complete:
+            raise ValueError(f"Unexpected data after JSON document: {ch!r}")
+
+        frame = self._stack[-1] if self._stack else None
+
+        if self._expecting_value():
+            self._started = True
+            if ch == '{':
+                self._stack.append({"type": "object", "key": None, "expect": "key", "empty": True})
+            elif ch == '[':
+                self._stack.append({"type": "array", "index": 0, "expect": "value", "empty": True})
+            elif ch == '"':
+                self._start_string(is_key=False)
+            elif ch == ']' and frame is not None and frame["type"] == "array" and frame["empty"]:
+                self._end_container()
+            elif ch in _LITERAL_START:
+                self._literal = ch
+            else:
+                raise ValueError(f"Expected a value, got {ch!r}")
+            return
+
+        if frame["expect"] == "key":
+            if ch == '"':
+                frame["empty"] = False
+                self._start_string(is_key=True)
+            elif ch == '}' and frame["empty"]:
+                self._end_container()
+            else:
+                raise ValueError(f"Expected object key, got {ch!r}")
+        elif frame["expect"] == "colon":
+            if ch != ':':
+                raise ValueError(f"Expected ':', got {ch!r}")
+            frame["expect"] = "value"
+        elif frame["expect"] == "comma":
+            if ch == ',':
+                if frame["type"] == "object":
+                    frame["expect"] = "key"
+                else:
+                    frame["index"] += 1
+                    frame["expect"] = "value"
+            elif (ch == '}' and frame["type"] == "object") or (ch == ']' and frame["type"] == "array"):
+                self._end_container()
+            else:
+                raise ValueError(f"Expected ',' or end of container, got {ch!r}")
+
+    def _start_string(self, is_key: bool) -> None:
+        self._in_string = True
+        self._is_key = is_key
+        self._buffer = []
+        self._sink = None if is_key else self._open_string(self._path())
+
+    def _feed_string(self, fragment: str, i: int) -> int:
+        if self._escape is not None:
+            self._escape += fragment[i]
+            i += 1
+            escape = self._escape
+            if escape[0] == 'u':
+                if len(escape) < 5:
+                    return i
+                if not _HEX_DIGITS.issuperset(escape[1:]):
+                    raise ValueError(f"Invalid unicode escape: \\{escape}")
+                self._escape = None
+                self._emit_code_unit(int(escape[1:], 16))
+            else:
+                if escape not in _ESCAPES:
+                    raise ValueError(f"Invalid escape: \\{escape}")
+                self._escape = None
+                self._emit(_ESCAPES[escape])
+            return i
+
+        match = _STRING_SPECIAL.search(fragment, i)
+        end = match.start() if match else len(fragment)
+        if end > i:
+            self._emit(fragment[i:end])
+        if not match:
+            return end
+        if fragment[end] == '\\':
+            self._escape = ''
+        elif fragment[end] == '"':
+            self._end_string()
+        else:
+            raise ValueError(f"Invalid control character in string: {fragment[end]!r}")
+        return end + 1
+
+    def _emit_code_unit(self, code_unit: int) -> None:
+        if 0xD800 <= code_unit < 0xDC00:
+            self._flush_surrogate()
+            self._high_surrogate = code_unit
+        elif 0xDC00 <= code_unit < 0xE000 and self._high_surrogate is not None:
+            high = self._high_surrogate
+            self._high_surrogate = None
+            self._write(chr(0x10000 + ((high - 0xD800) << 10) + (code_unit - 0xDC00)))
+        else:
+            self._emit(chr(code_unit))
+
+    def _flush_surrogate(self) -> None:
+        if self._high_surrogate is not None:
+            high = self._high_surrogate
+            self._high_surrogate = None
+            self._write(chr(high))
+
+    def _emit(self, text: str) -> None:
+        self._flush_surrogate()
+        self._write(text)
+
+    def _write(self, text: str) -> None:
+        if self._sink is not None:
+            self._sink.write(text)
+        else:
+            self._buffer.append(text)
+
+    def _end_string(self) -> None:
+        self._flush_surrogate()
+        self._in_string = False
+        value = "".join(self._buffer)
+        self._buffer = []
+
+        if self._is_key:
+            frame = self._stack[-1]
+            frame["key"] = value
+            frame["expect"] = "colon"
+            return
+
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+            self._end_value()
+        else:
+            self._end_value(value)
+
+    def _end_literal(self) -> None:
+        literal = self._literal
+        self._literal = None
+        try:
+            value = json.loads(literal)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid JSON value: {literal!r}")
+        self._end_value(value)
+
+    def _end_container(self) -> None:
+        self._stack.pop()
+        self._end_value()
+
+    def _end_value(self, *value: Any) -> None:
+        if value:
+            self._on_value(self._path(), value[0])
+        if not self._stack:
+            self.complete = True
+            return
+        frame = self._stack[-1]
+        frame["expect"] = "comma"
+        if frame["type"] == "array":
+            frame["empty"] = False
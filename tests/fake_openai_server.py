@@ -0,0 +1,95 @@
+"""Local OpenAI-compatible server that streams from several fake models.
+
+Each model waits a fixed delay before its first token, which makes it
+possible to exercise model routing without the real API. Run it directly
+and point the assistant at it with OPENAI_BASE_URL:
+
+    python -m tests.fake_openai_server
+    OPENAI_BASE_URL=http://127.0.0.1:8765/v1 python run.py
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Tuple
+
+# Seconds before the first token, per model name
+DEFAULT_DELAYS = {
+    "gpt-3.5-turbo": 0.05,
+    "gpt-4-turbo-preview": 0.5,
+    "slow-model": 3.0
+}
+
+def _chunk(model: str, delta: dict, finish_reason=None) -> bytes:
+    data = {
+        "id": "chatcmpl-fake",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]
+    }
+    return f"data: {json.dumps(data)}\n\n".encode("utf-8")
+
+def make_handler(delays: Dict[str, float]):
+    """Create a request handler serving the given model delays."""
+
+    class FakeOpenAIHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            model = body.get("model")
+
+            if model not in delays:
+                error = json.dumps({"error": {
+                    "message": f"The model '{model}' does not exist",
+                    "type": "invalid_request_error",
+                    "code": "model_not_found"
+                }}).encode("utf-8")
+                self.send_response(404)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(error)))
+                self.end_headers()
+                self.wfile.write(error)
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            time.sleep(delays[model])
+            try:
+                self.wfile.write(_chunk(model, {"role": "assistant", "content": f"Answer from {model}"}))
+                self.wfile.write(_chunk(model, {}, finish_reason="stop"))
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                # The client gave up on this model
+                pass
+
+        def log_message(self, format, *args):
+            pass
+
+    return FakeOpenAIHandler
+
+def start_server(
+    delays: Dict[str, float] = DEFAULT_DELAYS,
+    port: int = 0
+) -> Tuple[ThreadingHTTPServer, str]:
+    """Serve in a background thread.
+
+    Returns:
+        The server (call shutdown() when done) and its OpenAI base URL
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", port), make_handler(delays))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+if __name__ == "__main__":
+    server, base_url = start_server(port=8765)
+    print(f"Fake OpenAI endpoint at {base_url}; models: {', '.join(DEFAULT_DELAYS)}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,69 @@
+"""Tests for the content-addressed blob store and history references."""
+import os
+import tempfile
+import unittest
+from unittest import mock
+from src import config
+from src.assistant import Assistant
+from src.blob_store import BlobRef, BlobStore
+
+class BlobStoreTest(unittest.TestCase):
+    def test_identical_puts_share_one_blob(self):
+        store = BlobStore()
+        first = store.put("x" * 100)
+        second = store.put("x" * 100)
+        self.assertEqual(first, second)
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.stored_bytes, 100)
+        self.assertEqual(store.referenced_bytes, 200)
+        self.assertEqual(store.get(first), "x" * 100)
+
+    def test_disk_store_uses_own_subdirectory_and_clear_removes_it(self):
+        with tempfile.TemporaryDirectory() as directory:
+            store = BlobStore(directory)
+            other = BlobStore(directory)
+            ref = store.put("hello")
+            other_ref = other.put("hello")
+            self.assertNotEqual(store.directory, other.directory)
+            self.assertTrue(os.path.isfile(store._path(ref.digest)))
+
+            store.clear()
+            self.assertFalse(os.path.exists(store.directory))
+            self.assertEqual(len(store), 0)
+            # Another session's blobs are untouched
+            self.assertEqual(other.get(other_ref), "hello")
+
+            # The store keeps working after a clear
+            ref = store.put("again")
+            self.assertEqual(store.get(ref), "again")
+            store.clear()
+            other.clear()
+
+class AssistantHistoryTest(unittest.TestCase):
+    def setUp(self):
+        for name, value in (("OPENAI_API_KEY", "test-key"), ("BLOB_STORE_DIR", None)):
+            patcher = mock.patch.object(config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.assistant = Assistant()
+
+    def test_small_results_stay_inline(self):
+        content = "x" * (config.BLOB_MIN_SIZE - 1)
+        self.assertEqual(self.assistant._store_content(content), content)
+        self.assertEqual(len(self.assistant.blob_store), 0)
+
+    def test_create_messages_expands_refs(self):
+        content = "y" * config.BLOB_MIN_SIZE
+        for _ in range(2):
+            self.assistant._record_tool_call("read_files", "{}", content)
+
+        tool_messages = [m for m in self.assistant.conversation_history if m["role"] == "tool"]
+        self.assertTrue(all(isinstance(m["content"], BlobRef) for m in tool_messages))
+        self.assertEqual(len(self.assistant.blob_store), 1)
+
+        messages = self.assistant._create_messages("next")
+        expanded = [m["content"] for m in messages if m["role"] == "tool"]
+        self.assertEqual(expanded, [content, content])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,75 @@
+"""Model routing tests against the local fake OpenAI endpoint."""
+import unittest
+from unittest import mock
+from src import config
+from src.assistant import Assistant
+from src.router import ModelRouter
+from tests.fake_openai_server import start_server
+
+class NeedsToolsTest(unittest.TestCase):
+    def test_keywords_match_whole_words_and_paths(self):
+        self.assertTrue(ModelRouter.needs_tools("read the file"))
+        self.assertTrue(ModelRouter.needs_tools("fix src/main.py"))
+        self.assertTrue(ModelRouter.needs_tools("show /etc/hosts"))
+        self.assertFalse(ModelRouter.needs_tools("are you ready?"))
+        self.assertFalse(ModelRouter.needs_tools("decode this"))
+        self.assertFalse(ModelRouter.needs_tools("what time is it in Europe/London?"))
+
+class RecoveryTest(unittest.TestCase):
+    def test_demoted_model_is_retried_after_samples_expire(self):
+        router = ModelRouter(routes=[{"models": ["fast", "slow"]}], deadline=1.0, max_age=60.0)
+        with mock.patch("src.router.time.monotonic", return_value=0.0):
+            router.record_miss(router.route("hi", 2), "fast")
+            self.assertEqual(router.route("hi", 2).candidates, ["slow", "fast"])
+        with mock.patch("src.router.time.monotonic", return_value=61.0):
+            self.assertEqual(router.route("hi", 2).candidates, ["fast", "slow"])
+
+class FakeEndpointTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.server, base_url = start_server()
+        for name, value in (("OPENAI_BASE_URL", base_url), ("OPENAI_API_KEY", "test-key")):
+            patcher = mock.patch.object(config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        # Cleanups run in reverse: stop serving, then close the socket
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+    async def asyncSetUp(self):
+        self.assistant = Assistant()
+        self.assistant.router.deadline = 1.0
+        self.addAsyncCleanup(self.assistant.client.close)
+
+    def last_reply(self) -> str:
+        return self.assistant.conversation_history[-1]["content"]
+
+    async def test_trivial_prompt_goes_to_fast_model(self):
+        await self.assistant.get_response("what time is it?")
+        decision = self.assistant.router.decisions[-1]
+        self.assertEqual(decision.model, config.FAST_MODEL)
+        self.assertEqual(self.last_reply(), f"Answer from {config.FAST_MODEL}")
+
+    async def test_missed_deadline_falls_back(self):
+        self.assistant.router.routes = [{"models": ["slow-model", "gpt-3.5-turbo"]}]
+        await self.assistant.get_response("hi")
+        decision = self.assistant.router.decisions[-1]
+        self.assertEqual(decision.missed, ["slow-model"])
+        self.assertEqual(decision.model, "gpt-3.5-turbo")
+        self.assertLess(decision.ttft, self.assistant.router.deadline)
+        self.assertEqual(self.assistant.router.metrics()["slow-model"]["misses"], 1)
+
+    async def test_api_error_falls_back(self):
+        self.assistant.router.routes = [{"models": ["no-such-model", "gpt-3.5-turbo"]}]
+        await self.assistant.get_response("hi")
+        decision = self.assistant.router.decisions[-1]
+        self.assertEqual(decision.errors, ["no-such-model"])
+        self.assertEqual(decision.missed, [])
+        self.assertEqual(self.last_reply(), "Answer from gpt-3.5-turbo")
+
+        # An error is not a latency sample, so the model is not demoted
+        metrics = self.assistant.router.metrics()["no-such-model"]
+        self.assertEqual((metrics["errors"], metrics["misses"]), (1, 0))
+        self.assertIsNone(metrics["rolling_ttft"])
+
+if __name__ == "__main__":
+    unittest.main()
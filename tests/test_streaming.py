@@ -0,0 +1,142 @@
+"""Tests for streamed tool-call argument parsing and write_files streaming."""
+import asyncio
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+from src.tools.implementations.file_writer import StreamingFileWriter
+from src.tools.streaming import StreamingJsonParser
+
+DOCUMENTS = [
+    '{"files": [{"path": "a.txt", "content": "plain"}]}',
+    '{"content": "quote \\" slash \\\\ \\/ \\b\\f\\n\\r\\t", "n": -1.5e3, "ok": true, "no": null}',
+    '{"content": "\\u00e9\\u4e2d\\ud83d\\ude00 lone \\ud83d end", "list": [1, [], {}, [2, "x"]]}',
+    '{"files": [{"content": "emoji \\ud83d\\ude00\\ud83d\\ude01", "path": "b"}, {"path": "c", "content": ""}]}',
+]
+
+class _Sink(io.StringIO):
+    """Text stream that keeps its value after close()."""
+
+    def close(self):
+        self.final = self.getvalue()
+        super().close()
+
+def _flatten(value, path=()):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _flatten(item, path + (key,))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _flatten(item, path + (index,))
+    else:
+        yield path, value
+
+def _split(text, rng):
+    i = 0
+    while i < len(text):
+        n = rng.randint(1, 6)
+        yield text[i:i + n]
+        i += n
+
+class StreamingJsonParserTest(unittest.TestCase):
+    def parse(self, fragments):
+        values = {}
+        sinks = {}
+
+        def open_string(path):
+            if path and path[-1] == "content":
+                sinks[path] = _Sink()
+                return sinks[path]
+            return None
+
+        parser = StreamingJsonParser(open_string, values.__setitem__)
+        for fragment in fragments:
+            parser.feed(fragment)
+        self.assertTrue(parser.complete)
+        values.update((path, sink.final) for path, sink in sinks.items())
+        return values
+
+    def test_random_splits_match_json_loads(self):
+        rng = random.Random(0)
+        for document in DOCUMENTS:
+            expected = dict(_flatten(json.loads(document)))
+            # Every single split point, then many random splits
+            for i in range(len(document) + 1):
+                self.assertEqual(self.parse([document[:i], document[i:]]), expected)
+            for _ in range(50):
+                self.assertEqual(self.parse(_split(document, rng)), expected)
+
+    def test_rejects_what_json_loads_rejects(self):
+        for document in ['{"a": 1,}', '[1,]', '{"a": "x\ny"}', '{"a": "\\u 12a"}', '{"a": "\\x"}', '{"a": ]}']:
+            with self.assertRaises(json.JSONDecodeError):
+                json.loads(document)
+            parser = StreamingJsonParser(lambda path: None, lambda path, value: None)
+            with self.assertRaises(ValueError, msg=document):
+                parser.feed(document)
+
+class StreamingFileWriterTest(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.dir = directory.name
+
+    def path(self, *parts):
+        return os.path.join(self.dir, *parts)
+
+    def write(self, files, chunk=7):
+        writer = StreamingFileWriter()
+        document = json.dumps({"files": files})
+        for i in range(0, len(document), chunk):
+            writer.feed(document[i:i + chunk])
+        self.assertTrue(writer.complete)
+        return writer, asyncio.run(writer.finish())
+
+    def read(self, *parts):
+        with open(self.path(*parts), encoding="utf-8") as f:
+            return f.read()
+
+    def test_content_before_path(self):
+        self.write([{"content": "early", "path": self.path("sub", "late.txt")}])
+        self.assertEqual(self.read("sub", "late.txt"), "early")
+        self.assertEqual(os.listdir(self.path("sub")), ["late.txt"])
+
+    def test_append_mode(self):
+        self.write([
+            {"path": self.path("a.txt"), "content": "one"},
+            {"path": self.path("a.txt"), "content": "two", "mode": "a"}
+        ])
+        self.assertEqual(self.read("a.txt"), "onetwo")
+        self.assertEqual(os.listdir(self.dir), ["a.txt"])
+
+    def test_writes_through_symlink(self):
+        with open(self.path("real.txt"), "w") as f:
+            f.write("old")
+        os.symlink(self.path("real.txt"), self.path("link.txt"))
+        self.write([{"path": self.path("link.txt"), "content": "new"}])
+        self.assertTrue(os.path.islink(self.path("link.txt")))
+        self.assertEqual(self.read("real.txt"), "new")
+
+    def test_rejects_directory_target(self):
+        os.mkdir(self.path("dir"))
+        with self.assertRaises(ValueError):
+            self.write([{"path": self.path("dir"), "content": "x"}])
+
+    def test_duplicate_content_keeps_last(self):
+        writer = StreamingFileWriter()
+        writer.feed('{"files": [{"path": %s, "content": "first", "content": "second"}]}'
+                    % json.dumps(self.path("a.txt")))
+        asyncio.run(writer.finish())
+        self.assertEqual(self.read("a.txt"), "second")
+        self.assertEqual(os.listdir(self.dir), ["a.txt"])
+
+    def test_abort_leaves_nothing(self):
+        writer = StreamingFileWriter()
+        writer.feed('{"files": [{"path": %s, "content": "partial'
+                    % json.dumps(self.path("newdir", "a.txt")))
+        writer.abort()
+        self.assertEqual(os.listdir(self.dir), [])
+
+if __name__ == "__main__":
+    unittest.main()